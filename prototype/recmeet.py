@@ -2,21 +2,92 @@
 """recmeet — Improved meeting recorder with transcription and Grok summarization."""
 
 import argparse
+import bisect
+import hashlib
+import json
+import math
 import os
 import re
+import selectors
+import shutil
 import signal
+import struct
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import wave
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 
-import requests
 from dotenv import load_dotenv
 
 API_URL = "https://api.x.ai/v1/chat/completions"
+API_TIMEOUT = (10, 120)  # (connect, read) seconds
+SUMMARY_MODEL = "grok-3"
+SUMMARY_CHUNK_TOKENS = 3000
+SUMMARY_CHUNK_OVERLAP_TOKENS = 200
+CHARS_PER_TOKEN = 4  # rough estimate for English text
+SUMMARY_MAP_WORKERS = 8  # matches the session's connection pool size
+SUMMARY_FLUSH_CHARS = 4096  # streamed summary is flushed to disk in blocks of this size
+BYTES_PER_SECOND = 32000  # s16le mono @ 16 kHz, as produced by _build_record_cmd
+ROLLING_CHUNK_SECONDS = 30
+CUDA_BATCH_SIZE = 16  # 30s windows per batched encoder pass when batch_size is auto on CUDA
+SILENCE_THRESHOLD_DBFS = -45.0
+VAD_MODES = ("silero", "energy", "both", "none")
+TRANSCRIBE_BACKENDS = ("faster-whisper", "distil-whisper", "whispercpp")
+DISTIL_MODELS = {
+    "small": "distil-small.en",
+    "medium": "distil-medium.en",
+    "large-v2": "distil-large-v2",
+    "large-v3": "distil-large-v3",
+}
+GGML_QUANT_SUFFIXES = {"f16": "", "int8": "-q8_0", "int5": "-q5_0", "int4": "-q4_0"}
+ENERGY_VAD_THRESHOLD_DBFS = -40.0
+PACTL_CACHE_TTL = 5.0  # seconds a pactl source listing is reused
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "recmeet"
+WHISPER_CACHE_DIR = CACHE_DIR / "whisper"
+SUMMARY_CACHE_DIR = CACHE_DIR / "summaries"
+SUMMARY_SIMILARITY_THRESHOLD = 0.97
+
+
+_session_lock = threading.Lock()
+
+
+def _session():
+    """Return the process-wide HTTP session, creating it on first use.
+
+    requests is only imported here, so recording and transcription (and the
+    tray's startup) don't pay for it until a summary is requested.
+    """
+    with _session_lock:
+        return _make_session()
+
+
+@lru_cache(maxsize=1)
+def _make_session():
+    """Build a pooled HTTP session that retries transient API failures."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        read=0,  # a read timeout may mean Grok is still generating (and billing); don't resend
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None,  # POST is safe to retry here: summaries are idempotent
+        raise_on_status=False,  # hand the final error response back to the caller
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
 
 
 class AudioValidationError(Exception):
@@ -64,15 +135,37 @@ List of identifiable speakers/participants (if discernible from context).
 
 ## Transcript
 
+{transcript}
+"""
+SUMMARY_MAP_PROMPT = """\
+The following is part {index} of {total} of a meeting transcript.
+
+Write concise notes for this part only, covering: key points, decisions (who decided what),
+action items (owner, task, deadline if mentioned), open questions, and identifiable participants.
+Preserve names and timestamps. These notes will be merged with notes from the other parts.
+
+---
+
+## Transcript Part
+
 {transcript}
 """
 
 
+@lru_cache(maxsize=1)
+def _notify_send_path():
+    """Locate notify-send once per process (None if not installed)."""
+    return shutil.which("notify-send")
+
+
 def notify(title, body=""):
     """Send a desktop notification via notify-send (silently ignored if unavailable)."""
+    notify_send = _notify_send_path()
+    if notify_send is None:
+        return
     try:
         subprocess.Popen(
-            ["notify-send", "--app-name=recmeet", title, body],
+            [notify_send, "--app-name=recmeet", title, body],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -80,8 +173,11 @@ def notify(title, body=""):
         pass
 
 
-def _list_pactl_sources():
-    """Return a list of all PipeWire/PulseAudio source names."""
+def _iter_pactl_sources():
+    """Query pactl and return an iterator over PipeWire/PulseAudio source names.
+
+    pactl runs eagerly so DeviceError is raised here rather than on first iteration.
+    """
     try:
         result = subprocess.run(
             ["pactl", "list", "short", "sources"],
@@ -94,12 +190,55 @@ def _list_pactl_sources():
     except subprocess.CalledProcessError as e:
         raise DeviceError(f"pactl failed: {e.stderr.strip()}")
 
-    sources = []
-    for line in result.stdout.strip().splitlines():
-        fields = line.split("\t")
-        if len(fields) >= 2:
-            sources.append(fields[1])
-    return sources
+    return _parse_pactl_sources(result.stdout)
+
+
+# Second (name) column of a `pactl list short sources` line
+_PACTL_LINE_RE = re.compile(r"^[^\t\n]*\t([^\t\n]+)", re.MULTILINE)
+
+
+def _parse_pactl_sources(output):
+    """Yield the name column from `pactl list short sources` output."""
+    for match in _PACTL_LINE_RE.finditer(output):
+        yield match.group(1)
+
+
+_pactl_cache = None  # (monotonic timestamp, tuple of source names)
+_pactl_lock = threading.Lock()
+
+
+def _pactl_sources_cached(ttl=PACTL_CACHE_TTL):
+    """Return all source names, reusing a pactl listing younger than ttl seconds."""
+    global _pactl_cache
+    with _pactl_lock:
+        now = time.monotonic()
+        if _pactl_cache is not None and now - _pactl_cache[0] < ttl:
+            return _pactl_cache[1]
+        sources = tuple(_iter_pactl_sources())
+        _pactl_cache = (now, sources)
+        return sources
+
+
+def invalidate_sources_cache():
+    """Force the next source lookup to query pactl (e.g. after devices change)."""
+    global _pactl_cache
+    with _pactl_lock:
+        _pactl_cache = None
+
+
+def _list_pactl_sources():
+    """Return a list of all PipeWire/PulseAudio source names."""
+    return list(_pactl_sources_cached())
+
+
+@lru_cache(maxsize=16)
+def _compile_device_pattern(pattern):
+    """Compile a device-matching regex (case-insensitive), cached per pattern.
+
+    The flags are part of the cached value, not the key: if they change,
+    call _compile_device_pattern.cache_clear().
+    """
+    return re.compile(pattern, re.IGNORECASE)
 
 
 def detect_sources(pattern):
@@ -107,45 +246,74 @@ def detect_sources(pattern):
 
     Returns {"mic": name|None, "monitor": name|None, "all_sources": [...]}.
     Sources whose names end in .monitor are classified as monitors; others as mic inputs.
+    Scanning stops once both sources are found.
     """
-    all_sources = _list_pactl_sources()
-    regex = re.compile(pattern, re.IGNORECASE)
+    sources = _pactl_sources_cached()
+    regex = _compile_device_pattern(pattern)
 
     mic = None
     monitor = None
-    for name in all_sources:
+    for name in sources:
         if regex.search(name):
             if name.endswith(".monitor"):
                 monitor = monitor or name
             else:
                 mic = mic or name
+        if mic and monitor:
+            break
 
-    return {"mic": mic, "monitor": monitor, "all_sources": all_sources}
+    return {"mic": mic, "monitor": monitor, "all_sources": list(sources)}
 
 
+@lru_cache(maxsize=1)
 def find_recorder():
-    """Find the best available recorder binary. Prefer pw-record over parecord."""
+    """Find the best available recorder binary. Prefer pw-record over parecord.
+
+    The result is cached for the life of the process.
+    """
     for cmd in ["pw-record", "parecord"]:
-        if subprocess.run(["which", cmd], capture_output=True).returncode == 0:
+        if shutil.which(cmd):
             return cmd
     raise DeviceError("No recorder found. Install pipewire (pw-record) or pulseaudio-utils (parecord).")
 
 
-def display_elapsed(stop_event):
-    """Background thread that shows a live elapsed-time counter on stderr."""
+@lru_cache(maxsize=1)
+def _has_parecord():
+    """Return True if parecord is on PATH (cached for the life of the process)."""
+    return shutil.which("parecord") is not None
+
+
+@contextmanager
+def display_elapsed():
+    """Show a live elapsed-time counter on stderr while the block runs.
+
+    Driven by a 1s SIGALRM interval timer rather than a polling thread, so it
+    only works on the main thread; elsewhere (e.g. the tray) it does nothing.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
     start = time.monotonic()
-    while not stop_event.is_set():
-        elapsed = int(time.monotonic() - start)
-        mins, secs = divmod(elapsed, 60)
-        print(f"\rRecording... {mins:02d}:{secs:02d}", end="", flush=True, file=sys.stderr)
-        stop_event.wait(1.0)
-    # Clear the line
-    print("\r" + " " * 30 + "\r", end="", flush=True, file=sys.stderr)
+
+    def tick(_signum, _frame):
+        mins, secs = divmod(int(time.monotonic() - start), 60)
+        os.write(2, f"\rRecording... {mins:02d}:{secs:02d}".encode())
+
+    tick(None, None)
+    previous = signal.signal(signal.SIGALRM, tick)
+    signal.setitimer(signal.ITIMER_REAL, 1.0, 1.0)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        # Clear the line
+        os.write(2, ("\r" + " " * 30 + "\r").encode())
 
 
 def _build_record_cmd(recorder, source, output_path):
     """Build a recorder command list for the given source and output path."""
-    output_str = str(output_path)
     if recorder == "pw-record":
         return [
             "pw-record",
@@ -153,7 +321,7 @@ def _build_record_cmd(recorder, source, output_path):
             "--format", "s16",
             "--rate", "16000",
             "--channels", "1",
-            output_str,
+            output_path,
         ]
     return [
         "parecord",
@@ -162,7 +330,7 @@ def _build_record_cmd(recorder, source, output_path):
         "--format=s16le",
         "--rate=16000",
         "--channels=1",
-        output_str,
+        output_path,
     ]
 
 
@@ -180,36 +348,61 @@ def record_audio(source, output_path, stop_event=None):
     if stop_event is None:
         print("Press Ctrl+C to stop.\n")
 
-    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-
-    timer_event = threading.Event()
-    timer_thread = threading.Thread(target=display_elapsed, args=(timer_event,), daemon=True)
-    timer_thread.start()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            start_new_session=True)
 
     try:
         if stop_event is not None:
             while not stop_event.is_set() and proc.poll() is None:
                 stop_event.wait(0.2)
-            if proc.poll() is None:
-                proc.send_signal(signal.SIGINT)
-                try:
-                    proc.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
-                    proc.wait()
         else:
-            proc.wait()
+            with display_elapsed():
+                proc.wait()
     except KeyboardInterrupt:
-        proc.send_signal(signal.SIGINT)
-        proc.wait()
+        pass
     finally:
-        timer_event.set()
-        timer_thread.join(timeout=2)
+        _stop_recorder(proc)
 
     print("Recording stopped.")
     return output_path
 
 
+def _stop_recorder(proc):
+    """Stop a recorder started with start_new_session=True by signalling its process group.
+
+    Sends SIGINT so the recorder finalizes its WAV header, escalating to SIGTERM
+    after 2s and SIGKILL after a further 1s.
+    """
+    for sig, timeout in ((signal.SIGINT, 2), (signal.SIGTERM, 1), (signal.SIGKILL, None)):
+        if proc.poll() is not None:
+            return
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            pass
+        try:
+            proc.wait(timeout=timeout)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def _wait_for_any_exit(procs):
+    """Block until one of procs exits, without periodic wakeups.
+
+    Sleeps on the children's stderr pipes, draining anything they print, and
+    returns once one of them reaches EOF — i.e. that child has exited.
+    """
+    with selectors.DefaultSelector() as sel:
+        for proc in procs:
+            sel.register(proc.stderr, selectors.EVENT_READ, proc)
+        while True:
+            for key, _events in sel.select():
+                if not os.read(key.fd, 4096):
+                    key.data.wait()
+                    return
+
+
 def record_dual_audio(mic_source, monitor_source, mic_path, monitor_path, stop_event=None):
     """Record from mic and monitor sources in parallel.
 
@@ -222,7 +415,7 @@ def record_dual_audio(mic_source, monitor_source, mic_path, monitor_path, stop_e
     recorder = find_recorder()
     mic_cmd = _build_record_cmd(recorder, mic_source, mic_path)
     # Monitor sources require parecord — pw-record records silence from .monitor names
-    if subprocess.run(["which", "parecord"], capture_output=True).returncode != 0:
+    if not _has_parecord():
         raise DeviceError("parecord required for monitor capture. Install pipewire-pulse or pulseaudio-utils.")
     monitor_cmd = _build_record_cmd("parecord", monitor_source, monitor_path)
 
@@ -231,21 +424,10 @@ def record_dual_audio(mic_source, monitor_source, mic_path, monitor_path, stop_e
     if stop_event is None:
         print("Press Ctrl+C to stop.\n")
 
-    mic_proc = subprocess.Popen(mic_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    monitor_proc = subprocess.Popen(monitor_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-
-    timer_event = threading.Event()
-    timer_thread = threading.Thread(target=display_elapsed, args=(timer_event,), daemon=True)
-    timer_thread.start()
-
-    def _stop_proc(proc):
-        """Send SIGINT, wait up to 5s, then SIGKILL if still alive."""
-        try:
-            proc.send_signal(signal.SIGINT)
-            proc.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            proc.wait()
+    mic_proc = subprocess.Popen(mic_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                start_new_session=True)
+    monitor_proc = subprocess.Popen(monitor_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    start_new_session=True)
 
     try:
         if stop_event is not None:
@@ -253,40 +435,111 @@ def record_dual_audio(mic_source, monitor_source, mic_path, monitor_path, stop_e
                 stop_event.wait(0.2)
         else:
             # Wait for either process to exit (shouldn't happen before Ctrl+C)
-            while mic_proc.poll() is None and monitor_proc.poll() is None:
-                time.sleep(0.1)
+            with display_elapsed():
+                _wait_for_any_exit([mic_proc, monitor_proc])
     except KeyboardInterrupt:
         pass
     finally:
-        _stop_proc(mic_proc)
-        _stop_proc(monitor_proc)
-        timer_event.set()
-        timer_thread.join(timeout=2)
+        _stop_recorder(mic_proc)
+        _stop_recorder(monitor_proc)
 
     print("Recording stopped.")
 
 
+def _read_pcm16(path):
+    """Read a recorder WAV as an int16 NumPy array.
+
+    Returns None unless the header declares the s16 mono 16 kHz format that
+    _build_record_cmd requests. A truncated header (common when pw-record is
+    interrupted) is tolerated by reading the data chunk through to EOF (see
+    _wav_format).
+    """
+    import numpy as np
+
+    fmt = _wav_format(path)
+    if fmt is None or (fmt.channels, fmt.bits, fmt.rate) != (1, 16, 16000):
+        return None
+    return np.fromfile(path, dtype=np.int16, count=fmt.data_size // 2, offset=fmt.data_offset)
+
+
+def _level_dbfs(path):
+    """Return the RMS level of a recorder WAV in dBFS, or None if it can't be read."""
+    try:
+        import numpy as np
+        pcm = _read_pcm16(path)
+    except ImportError:
+        return None
+    if pcm is None or len(pcm) == 0:
+        return None
+
+    # Accumulate in blocks to avoid a full-length float copy of long recordings
+    total = 0.0
+    for i in range(0, len(pcm), 1 << 20):
+        block = pcm[i:i + (1 << 20)].astype(np.float32)
+        total += float(np.dot(block, block))
+    rms = math.sqrt(total / len(pcm)) / 32768.0
+    return 20 * math.log10(max(rms, 1e-9))
+
+
+def _mix_pcm16(mic_path, monitor_path, output_path):
+    """Mix two s16 mono 16 kHz WAVs in-process and return the mixed int16 samples.
+
+    Returns None if NumPy is unavailable or either input has another format.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    a = _read_pcm16(mic_path)
+    b = _read_pcm16(monitor_path)
+    if a is None or b is None:
+        return None
+
+    if len(a) < len(b):
+        a, b = b, a
+    mixed = a.astype(np.int32)
+    mixed[:len(b)] += b
+    np.clip(mixed, -32768, 32767, out=mixed)
+    mixed = mixed.astype("<i2")
+
+    with wave.open(str(output_path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(mixed.tobytes())
+    return mixed
+
+
 def mix_audio(mic_path, monitor_path, output_path):
-    """Mix mic and monitor WAV files into a single file using ffmpeg.
+    """Mix mic and monitor WAV files into a single file.
+
+    Sums the samples in-process when both files are in the expected recorder
+    format; otherwise uses ffmpeg. Falls back to copying the mic recording if
+    ffmpeg fails.
 
-    Falls back to copying the mic recording if ffmpeg fails.
+    Returns the mixed int16 samples when mixed in-process (so the caller can
+    transcribe them without re-reading the file), otherwise None.
     """
-    import shutil
+    mixed = _mix_pcm16(mic_path, monitor_path, output_path)
+    if mixed is not None:
+        print(f"Mixed audio saved: {output_path}")
+        return mixed
 
     cmd = [
         "ffmpeg", "-y",
-        "-i", str(mic_path),
-        "-i", str(monitor_path),
+        "-i", mic_path,
+        "-i", monitor_path,
         "-filter_complex", "amix=inputs=2:duration=longest:normalize=0",
         "-ar", "16000",
         "-ac", "1",
-        str(output_path),
+        output_path,
     ]
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
         if result.returncode == 0:
             print(f"Mixed audio saved: {output_path}")
-            return
+            return None
         print(f"Warning: ffmpeg mix failed (exit {result.returncode}): {result.stderr.strip()}", file=sys.stderr)
     except FileNotFoundError:
         print("Warning: ffmpeg not found, cannot mix audio streams.", file=sys.stderr)
@@ -295,14 +548,62 @@ def mix_audio(mic_path, monitor_path, output_path):
 
     # Fallback: use mic recording as the combined audio
     print("Falling back to mic-only audio for transcription.", file=sys.stderr)
-    shutil.copy2(str(mic_path), str(output_path))
+    shutil.copy2(mic_path, output_path)
+    return None
+
+
+WavFormat = namedtuple("WavFormat", "channels bits rate block_align data_offset data_size")
+
+
+def _wav_format(path):
+    """Read a WAV's format and data-chunk location by walking its RIFF chunk headers.
+
+    Returns a WavFormat, or None if the file isn't a WAV or has no data chunk
+    yet. Only chunk headers are read and the RIFF size field is ignored, so a
+    header left truncated by an interrupted pw-record still parses: a zero or
+    oversized data-chunk length is replaced by the bytes actually present.
+    The recorder format is assumed if no fmt chunk precedes the data.
+    """
+    try:
+        with open(path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+                return None
+            channels, bits, rate, block_align = 1, 16, 16000, 2
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    return None
+                tag, size = chunk[:4], struct.unpack_from("<I", chunk, 4)[0]
+                if tag == b"data":
+                    offset = f.tell()
+                    available = file_size - offset
+                    if size == 0 or size > available:
+                        size = available
+                    return WavFormat(channels, bits, rate, block_align, offset, size)
+                if tag == b"fmt " and size >= 16:
+                    _fmt, channels, rate, _byte_rate, block_align, bits = struct.unpack("<HHIIHH", f.read(16))
+                    size -= 16
+                f.seek(size + (size & 1), 1)
+    except (OSError, struct.error):
+        return None
+
+
+def _wav_duration_fast(path):
+    """Return (duration_seconds, sample_rate) from a WAV's RIFF header, or None if it isn't one."""
+    fmt = _wav_format(path)
+    if fmt is None or fmt.rate == 0 or fmt.block_align == 0:
+        return None
+    return fmt.data_size / (fmt.rate * fmt.block_align), fmt.rate
 
 
 def validate_audio(path, min_duration=1.0, label="Audio"):
     """Validate that the audio file exists and has a minimum duration.
 
-    Tries Python's wave module first. If the WAV header is truncated (common when
-    pw-record is interrupted), falls back to ffprobe, then to a raw file-size estimate.
+    The duration is computed from the RIFF header and the file size, which also
+    covers recordings whose header was left truncated by an interrupted
+    pw-record. Files that aren't WAV at all fall back to a raw file-size estimate.
 
     Raises AudioValidationError on failure.
     """
@@ -310,120 +611,871 @@ def validate_audio(path, min_duration=1.0, label="Audio"):
     if not path.exists() or path.stat().st_size == 0:
         raise AudioValidationError(f"{label} file is missing or empty.")
 
-    # Try standard wave module
-    try:
-        with wave.open(str(path), "rb") as wf:
-            frames = wf.getnframes()
-            rate = wf.getframerate()
-            if rate > 0 and frames > 0:
-                duration = frames / rate
-                if duration < min_duration:
-                    raise AudioValidationError(f"{label} too short ({duration:.1f}s).")
-                print(f"{label} validated: {duration:.1f}s, {rate}Hz")
-                return duration
-    except wave.Error:
-        pass
-
-    # Fallback: try ffprobe
-    try:
-        result = subprocess.run(
-            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-             "-of", "default=noprint_wrappers=1:nokey=1", str(path)],
-            capture_output=True, text=True, timeout=10,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            duration = float(result.stdout.strip())
-            if duration < min_duration:
-                raise AudioValidationError(f"{label} too short ({duration:.1f}s).")
-            print(f"{label} validated (ffprobe): {duration:.1f}s")
-            return duration
-    except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
-        pass
+    info = _wav_duration_fast(path)
+    if info is not None:
+        duration, rate = info
+        if duration <= 0:
+            raise AudioValidationError(f"{label} file contains no data.")
+        if duration < min_duration:
+            raise AudioValidationError(f"{label} too short ({duration:.1f}s).")
+        print(f"{label} validated: {duration:.1f}s, {rate}Hz")
+        return duration
 
     # Last resort: estimate from file size (16kHz, 16-bit mono = 32000 bytes/sec)
     # WAV header is 44 bytes
     data_size = path.stat().st_size - 44
     if data_size <= 0:
         raise AudioValidationError(f"{label} file contains no data.")
-    duration = data_size / 32000
+    duration = data_size / BYTES_PER_SECOND
     if duration < min_duration:
         raise AudioValidationError(f"{label} too short (~{duration:.1f}s).")
     print(f"{label} validated (estimated): ~{duration:.1f}s")
     return duration
 
 
-def format_timestamp(seconds):
+def format_timestamp(seconds: float) -> str:
     """Format seconds as MM:SS."""
     mins, secs = divmod(int(seconds), 60)
     return f"{mins:02d}:{secs:02d}"
 
 
-def transcribe_audio(audio_path, model_name):
-    """Transcribe audio using faster-whisper and return timestamped text."""
+def _format_segment_line(start: float, end: float, text: str) -> str:
+    """Return one newline-terminated transcript line: "[MM:SS - MM:SS] text"."""
+    return f"[{format_timestamp(start)} - {format_timestamp(end)}] {text}\n"
+
+
+def _available_cores():
+    """Number of CPUs this process may run on (respects affinity masks / cgroups cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _resolve_backend(device="auto", compute_type="auto", threads=0):
+    """Resolve the CTranslate2 device, compute type, and CPU thread count for faster-whisper.
+
+    "auto" selects CUDA with int8_float16 (int8 weights, fp16 activations) when a
+    GPU is visible to CTranslate2, otherwise CPU with int8. threads=0 uses every
+    core available to the process.
+    """
+    threads = threads or _available_cores()
+    # Must run before the first ctranslate2 import below or in _load_whisper
+    _configure_cpu_runtime(threads)
+    if device == "auto":
+        try:
+            import ctranslate2
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except (ImportError, RuntimeError):
+            device = "cpu"
+    if compute_type == "auto":
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+    return device, compute_type, threads
+
+
+def _configure_cpu_runtime(cpu_threads):
+    """Set OpenMP/oneDNN tuning variables before the inference libraries initialize.
+
+    Uses setdefault so values already in the environment win. BF16 fpmath lets
+    oneDNN use bf16 kernels on CPUs that have them (e.g. Arm Neoverse, AVX512-BF16).
+    Only effective if called before CTranslate2 is first imported.
+    """
+    os.environ.setdefault("OMP_NUM_THREADS", str(cpu_threads))
+    os.environ.setdefault("DNNL_DEFAULT_FPMATH_MODE", "BF16")
+    os.environ.setdefault("LRU_CACHE_CAPACITY", "1024")
+    os.environ.setdefault("THP_MEM_ALLOC_ENABLE", "1")
+
+
+_whisper_lock = threading.Lock()
+
+
+def _get_whisper(model_name, device, compute_type, cpu_threads):
+    """Return the cached WhisperModel, serializing loads so a warm-up and a
+    transcription racing on the same key share a single instance."""
+    with _whisper_lock:
+        return _load_whisper(model_name, device, compute_type, cpu_threads)
+
+
+@lru_cache(maxsize=2)
+def _load_whisper(model_name, device, compute_type, cpu_threads):
+    """Load a WhisperModel once per (model, device, compute_type, cpu_threads) for the process lifetime.
+
+    Weights are downloaded to WHISPER_CACHE_DIR so repeated runs reuse them.
+    Every caller decodes one window at a time, so a single worker gets all
+    cpu_threads instead of splitting them across idle workers.
+    """
     try:
         from faster_whisper import WhisperModel
     except ImportError:
         raise RecmeetError("faster-whisper not installed. Run: pip install faster-whisper")
 
-    print(f"Loading Whisper model '{model_name}'...")
-    model = WhisperModel(model_name, compute_type="int8")
+    print(f"Loading Whisper model '{model_name}' ({device}, {compute_type})...")
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=1,
+        download_root=WHISPER_CACHE_DIR,
+        local_files_only=False,
+    )
+
+
+def get_whisper_model(model_name, device="auto", compute_type="auto", threads=0):
+    """Return the process-wide WhisperModel for these settings, loading it on first use."""
+    return _get_whisper(model_name, *_resolve_backend(device, compute_type, threads))
+
+
+def warm_whisper(model_name, device="auto", compute_type="auto", threads=0):
+    """Preload a Whisper model into the process cache (safe to call from a thread)."""
+    try:
+        get_whisper_model(model_name, device, compute_type, threads)
+    except Exception as e:
+        print(f"Warning: Whisper warm-up failed: {e}", file=sys.stderr)
 
-    print("Transcribing...")
-    segments, info = model.transcribe(str(audio_path), beam_size=5)
 
-    lines = []
-    for segment in segments:
-        start = format_timestamp(segment.start)
-        end = format_timestamp(segment.end)
-        lines.append(f"[{start} - {end}] {segment.text.strip()}")
+def _write_segments(f, segments, offset=0.0, count=0, time_map=None):
+    """Write faster-whisper segments to an open transcript file as timestamped lines.
 
-    transcript = "\n".join(lines)
-    if not transcript.strip():
+    Timestamps are passed through `time_map` (if given), then shifted by `offset`
+    seconds. Each line is flushed as it is written. Posts a progress
+    notification every 50 segments.
+
+    Returns (count, has_text), where count continues from the given starting count.
+    """
+    has_text = False
+    for count, segment in enumerate(segments, count + 1):
+        text = segment.text.strip()
+        has_text = has_text or bool(text)
+        seg_start, seg_end = segment.start, segment.end
+        if time_map is not None:
+            seg_start, seg_end = time_map(seg_start), time_map(seg_end)
+        f.write(_format_segment_line(seg_start + offset, seg_end + offset, text))
+        f.flush()
+        if count % 50 == 0:
+            notify("Transcribing...", f"{count} segments")
+    return count, has_text
+
+
+class RollingTranscriber:
+    """Transcribe recordings in fixed-length windows while they are still being captured.
+
+    A background thread tails the PCM appended to each growing WAV file, mixes
+    the tracks, and appends timestamped lines to transcript_path. Once recording
+    stops, only the final partial window remains to be transcribed.
+    """
+
+    def __init__(self, wav_paths, transcript_path, model_name, device="auto",
+                 compute_type="auto", beam_size=5, threads=0, chunk_seconds=ROLLING_CHUNK_SECONDS,
+                 language=None):
+        self.wav_paths = [Path(p) for p in wav_paths]
+        self.transcript_path = Path(transcript_path)
+        self.model_name = model_name
+        self.backend = _resolve_backend(device, compute_type, threads)
+        self.beam_size = beam_size
+        self.language = language
+        self.chunk_bytes = chunk_seconds * BYTES_PER_SECOND
+        self.count = 0
+        self.has_text = False
+        self._error = None
+        self._done = threading.Event()
+        self._abort = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def abort(self):
+        """Stop the worker without transcribing any remaining audio."""
+        self._abort.set()
+        self._done.set()
+        self._thread.join()
+
+    def finish(self):
+        """Signal that recording has stopped, transcribe the tail, and wait for completion.
+
+        Returns transcript_path. Raises RecmeetError if nothing was transcribed.
+        """
+        self._done.set()
+        self._thread.join()
+        if self._error is not None:
+            raise RecmeetError(f"Transcription failed: {self._error}")
+        if not self.has_text:
+            raise RecmeetError("Transcription produced no text.")
+        print(f"Transcribed {self.count} segments")
+        return self.transcript_path
+
+    def _run(self):
+        try:
+            model = _get_whisper(self.model_name, *self.backend)
+            offsets = {}
+            pos = 0
+            with open(self.transcript_path, "w") as f:
+                while not self._abort.is_set():
+                    finished = self._done.is_set()
+                    for path in self.wav_paths:
+                        if path not in offsets:
+                            fmt = _wav_format(path)
+                            if fmt is not None:
+                                offsets[path] = fmt.data_offset
+
+                    # While recording, wait for every track; afterwards use whatever exists
+                    if offsets and (finished or len(offsets) == len(self.wav_paths)):
+                        sizes = [p.stat().st_size - off for p, off in offsets.items()]
+                        avail = (max(sizes) if finished else min(sizes)) - pos
+                        while avail >= self.chunk_bytes or (finished and avail > 1):
+                            # abort() joins this thread; don't make it wait for a backlog
+                            if self._abort.is_set():
+                                break
+                            n = min(avail, self.chunk_bytes) & ~1
+                            self._transcribe_window(model, f, offsets, pos, n)
+                            pos += n
+                            avail -= n
+
+                    if finished:
+                        break
+                    self._done.wait(1.0)
+        except Exception as e:
+            self._error = e
+
+    def _transcribe_window(self, model, f, offsets, pos, n):
+        import numpy as np
+
+        mixed = np.zeros(n // 2, dtype=np.int32)
+        for path, off in offsets.items():
+            with open(path, "rb") as wf:
+                wf.seek(off + pos)
+                buf = wf.read(n)
+            pcm = np.frombuffer(buf[:len(buf) & ~1], dtype=np.int16)
+            mixed[:len(pcm)] += pcm
+        audio = np.clip(mixed, -32768, 32767).astype(np.float32) / 32768.0
+
+        segments, _info = model.transcribe(
+            audio,
+            language=self.language,
+            beam_size=self.beam_size,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=500),
+            condition_on_previous_text=False,
+        )
+        self.count, has_text = _write_segments(
+            f, segments, offset=pos / BYTES_PER_SECOND, count=self.count,
+        )
+        self.has_text = self.has_text or has_text
+
+
+def _load_audio(path, pcm=None):
+    """Decode a recording for faster-whisper.
+
+    Recorder output (s16 mono 16 kHz) is converted straight to float32 samples,
+    sparing faster-whisper its own PyAV decode and resample pass. Anything else
+    is returned as a path for faster-whisper to decode itself. Samples already
+    in memory can be passed as `pcm` to skip reading the file.
+    """
+    if pcm is None:
+        try:
+            pcm = _read_pcm16(path)
+        except ImportError:
+            pass
+    if pcm is None:
+        return str(path)
+    return pcm.astype("float32") / 32768.0
+
+
+def trim_silence(audio, sr=16000, frame_ms=30, thresh_db=ENERGY_VAD_THRESHOLD_DBFS, pad_ms=300):
+    """Drop low-energy stretches from float32 audio using per-frame RMS.
+
+    Frames within pad_ms of a frame at or above thresh_db are kept so word
+    onsets and tails survive.
+
+    Returns (voiced, spans): the concatenated kept audio, and a list of
+    (trimmed_start, original_start) sample offsets, one per kept run, for
+    mapping timestamps back to the original recording.
+    """
+    import numpy as np
+
+    frame = sr * frame_ms // 1000
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return audio, [(0, 0)]
+
+    # Per-frame RMS in blocks, so long recordings don't need a full squared copy
+    rms = np.empty(n_frames, dtype=np.float32)
+    block = 10000
+    for i in range(0, n_frames, block):
+        frames = audio[i * frame:min(i + block, n_frames) * frame].reshape(-1, frame)
+        rms[i:i + len(frames)] = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+    voiced = 20 * np.log10(np.maximum(rms, 1e-9)) >= thresh_db
+
+    pad = max(1, pad_ms // frame_ms)
+    keep = np.convolve(voiced.astype(np.int32), np.ones(2 * pad + 1, dtype=np.int32), mode="same") > 0
+    # The trailing partial frame follows its predecessor
+    keep = np.append(keep, keep[-1]) if len(audio) > n_frames * frame else keep
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], keep.astype(np.int8), [0]))))
+    if len(edges) == 0:
+        return audio[:0], [(0, 0)]
+
+    pieces = []
+    spans = []
+    trimmed = 0
+    for start_frame, end_frame in zip(edges[::2], edges[1::2]):
+        start, end = start_frame * frame, min(end_frame * frame, len(audio))
+        spans.append((trimmed, start))
+        pieces.append(audio[start:end])
+        trimmed += end - start
+    return np.concatenate(pieces), spans
+
+
+def _span_time_map(spans, sr=16000):
+    """Build a function mapping seconds in trimmed audio back to the original recording."""
+    trimmed_starts = [t for t, _ in spans]
+
+    def time_map(seconds):
+        sample = seconds * sr
+        i = max(bisect.bisect_right(trimmed_starts, sample) - 1, 0)
+        trimmed_start, original_start = spans[i]
+        return (original_start + sample - trimmed_start) / sr
+
+    return time_map
+
+
+Segment = namedtuple("Segment", "start end text")
+
+
+class Transcriber(ABC):
+    """A speech-to-text backend.
+
+    transcribe(audio, vad_filter) returns (segments, detail): an iterable of
+    objects with start/end (seconds) and text, plus a short description of the
+    run for logging. Backends with accepts_arrays=False need a file path.
+    """
+
+    accepts_arrays = True
+
+    @abstractmethod
+    def transcribe(self, audio, vad_filter=True):
+        """Transcribe audio (float32 samples or a file path); see the class docstring."""
+
+
+def _auto_batch_size(device, cpu_threads):
+    """Pick how many 30s windows to batch through the encoder at once."""
+    if device == "cuda":
+        return CUDA_BATCH_SIZE
+    return max(1, cpu_threads // 4)
+
+
+class FasterWhisperTranscriber(Transcriber):
+    """faster-whisper (CTranslate2) backend, using the process-wide model cache.
+
+    With batch_size > 1 and Silero VAD on, speech windows are decoded in batches
+    through faster-whisper's BatchedInferencePipeline (faster-whisper >= 1.1).
+    batch_size=0 picks a size for the device (see _auto_batch_size). A known
+    language skips Whisper's language-detection pass.
+    """
+
+    def __init__(self, model_name, device="auto", compute_type="auto", beam_size=5, threads=0,
+                 batch_size=0, language=None):
+        device, compute_type, cpu_threads = _resolve_backend(device, compute_type, threads)
+        self.model = _get_whisper(model_name, device, compute_type, cpu_threads)
+        self.beam_size = beam_size
+        self.batch_size = batch_size or _auto_batch_size(device, cpu_threads)
+        self.language = language
+
+    def _batched_pipeline(self):
+        """Return a BatchedInferencePipeline over the model, or None if unavailable."""
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            return None
+        return BatchedInferencePipeline(model=self.model)
+
+    def transcribe(self, audio, vad_filter=True):
+        options = dict(
+            language=self.language,
+            beam_size=self.beam_size,
+            vad_filter=vad_filter,
+            vad_parameters=dict(min_silence_duration_ms=500),
+            condition_on_previous_text=False,
+        )
+        # The batched pipeline needs VAD (or clip timestamps) to cut the audio into windows
+        pipeline = self._batched_pipeline() if self.batch_size > 1 and vad_filter else None
+        if pipeline is not None:
+            # The pipeline defaults to without_timestamps=True, which emits one
+            # segment per ~30s VAD chunk instead of per utterance
+            segments, info = pipeline.transcribe(audio, batch_size=self.batch_size,
+                                                 without_timestamps=False, **options)
+            batching = f", batch size: {self.batch_size}"
+        else:
+            segments, info = self.model.transcribe(audio, **options)
+            batching = ""
+        return segments, f"language: {info.language}, prob: {info.language_probability:.2f}{batching}"
+
+
+class DistilWhisperTranscriber(FasterWhisperTranscriber):
+    """faster-whisper running the Distil-Whisper checkpoint for the chosen model size."""
+
+    def __init__(self, model_name, device="auto", compute_type="auto", beam_size=5, threads=0,
+                 batch_size=0, language=None):
+        super().__init__(_distil_model_name(model_name), device, compute_type, beam_size, threads,
+                         batch_size, language)
+
+
+def _distil_model_name(model_name):
+    """Map a Whisper model size to its Distil-Whisper checkpoint (distil-* names pass through)."""
+    if model_name.startswith("distil-"):
+        return model_name
+    if model_name not in DISTIL_MODELS:
+        raise RecmeetError(
+            f"No Distil-Whisper checkpoint for '{model_name}' "
+            f"(use one of: {', '.join(DISTIL_MODELS)})."
+        )
+    return DISTIL_MODELS[model_name]
+
+
+def _whispercpp_files(model_name, quantization):
+    """Return (whisper-cli path, ggml model path), raising RecmeetError if either is missing."""
+    if quantization not in GGML_QUANT_SUFFIXES:
+        raise RecmeetError(
+            f"Unknown quantization '{quantization}' "
+            f"(expected one of: {', '.join(GGML_QUANT_SUFFIXES)})."
+        )
+    binary = shutil.which("whisper-cli")
+    if binary is None:
+        raise RecmeetError("whisper-cli not found. Install whisper.cpp or use --backend faster-whisper.")
+    model_path = WHISPER_CACHE_DIR / "ggml" / f"ggml-{model_name}{GGML_QUANT_SUFFIXES[quantization]}.bin"
+    if not model_path.exists():
+        raise RecmeetError(f"whisper.cpp model not found: {model_path}")
+    return binary, model_path
+
+
+class WhisperCppTranscriber(Transcriber):
+    """whisper.cpp backend, running whisper-cli on an integer-quantized ggml model.
+
+    Models are looked up as WHISPER_CACHE_DIR/ggml/ggml-<model>[-<quant>].bin.
+    whisper.cpp has no built-in VAD without a separate model, so vad_filter is ignored.
+    """
+
+    accepts_arrays = False
+
+    def __init__(self, model_name, quantization="int8", beam_size=5, threads=0, language=None):
+        self.binary, self.model_path = _whispercpp_files(model_name, quantization)
+        self.beam_size = beam_size
+        self.threads = threads or _available_cores()
+        self.language = language
+
+    def transcribe(self, audio, vad_filter=True):
+        with tempfile.TemporaryDirectory(prefix="recmeet-") as tmp:
+            out_base = Path(tmp) / "transcript"
+            cmd = [
+                self.binary,
+                "-m", self.model_path,
+                "-f", audio,
+                "-t", str(self.threads),
+                "-bs", str(self.beam_size),
+                "-l", self.language or "auto",
+                "-np",
+                "-oj",
+                "-of", out_base,
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RecmeetError(f"whisper-cli failed (exit {result.returncode}): {result.stderr.strip()}")
+            data = json.loads(out_base.with_suffix(".json").read_text())
+
+        segments = [
+            Segment(entry["offsets"]["from"] / 1000, entry["offsets"]["to"] / 1000, entry["text"])
+            for entry in data.get("transcription", [])
+        ]
+        language = data.get("result", {}).get("language", "unknown")
+        return segments, f"language: {language}, model: {self.model_path.name}"
+
+
+def make_transcriber(backend, model_name, device="auto", compute_type="auto",
+                     beam_size=5, threads=0, quantization="int8", batch_size=0, language=None):
+    """Construct the Transcriber for the named backend (see TRANSCRIBE_BACKENDS)."""
+    if backend == "faster-whisper":
+        return FasterWhisperTranscriber(model_name, device, compute_type, beam_size, threads,
+                                        batch_size, language)
+    if backend == "distil-whisper":
+        return DistilWhisperTranscriber(model_name, device, compute_type, beam_size, threads,
+                                        batch_size, language)
+    if backend == "whispercpp":
+        return WhisperCppTranscriber(model_name, quantization, beam_size, threads, language)
+    raise RecmeetError(
+        f"Unknown transcription backend '{backend}' "
+        f"(expected one of: {', '.join(TRANSCRIBE_BACKENDS)})."
+    )
+
+
+def check_transcription_options(backend, model_name, quantization="int8", vad="silero",
+                                batch_size=0, rolling=False):
+    """Raise RecmeetError if these settings can't work, without loading any model.
+
+    Lets run_pipeline reject a bad configuration before recording starts
+    rather than after the meeting is over. Combinations that would silently
+    ignore a setting are rejected too.
+    """
+    if vad not in VAD_MODES:
+        raise RecmeetError(f"Unknown VAD mode '{vad}' (expected one of: {', '.join(VAD_MODES)}).")
+    if rolling:
+        # RollingTranscriber always decodes sequentially with faster-whisper and Silero VAD
+        if backend != "faster-whisper":
+            raise RecmeetError(f"Rolling transcription only supports the faster-whisper backend, not '{backend}'.")
+        if vad != "silero":
+            raise RecmeetError(f"Rolling transcription always uses Silero VAD; '{vad}' is not supported.")
+        if batch_size > 1:
+            raise RecmeetError("Batched decoding is not supported with rolling transcription.")
+    if backend == "whispercpp" and vad in ("energy", "both"):
+        raise RecmeetError("Energy VAD needs in-memory audio, which the whispercpp backend can't take.")
+    if backend == "distil-whisper":
+        _distil_model_name(model_name)
+    elif backend == "whispercpp":
+        _whispercpp_files(model_name, quantization)
+    elif backend != "faster-whisper":
+        raise RecmeetError(
+            f"Unknown transcription backend '{backend}' "
+            f"(expected one of: {', '.join(TRANSCRIBE_BACKENDS)})."
+        )
+
+
+def transcribe_audio(audio_path, transcript_path, model_name, device="auto",
+                     compute_type="auto", beam_size=5, threads=0, pcm=None, vad="silero",
+                     backend="faster-whisper", quantization="int8", batch_size=0, language=None):
+    """Transcribe audio, streaming timestamped lines to transcript_path.
+
+    Segments are written and flushed as they are decoded, so the transcript can
+    be followed while transcription is still running. If the int16 samples of
+    audio_path are already in memory, pass them as `pcm`. Returns transcript_path.
+
+    vad selects how silence is skipped: "silero" (faster-whisper's VAD filter),
+    "energy" (trim_silence before decoding), "both", or "none". Energy trimming
+    needs the audio in the recorder format and a backend that accepts sample
+    arrays; timestamps still refer to the original recording.
+
+    backend is one of TRANSCRIBE_BACKENDS; quantization only applies to whispercpp
+    and batch_size (0 = auto) to the faster-whisper based backends. language
+    (e.g. "en") skips language detection; None detects it from the audio.
+    """
+    if vad not in VAD_MODES:
+        raise RecmeetError(f"Unknown VAD mode '{vad}' (expected one of: {', '.join(VAD_MODES)}).")
+
+    transcriber = make_transcriber(backend, model_name, device, compute_type,
+                                   beam_size, threads, quantization, batch_size, language)
+
+    audio = _load_audio(audio_path, pcm) if transcriber.accepts_arrays else str(audio_path)
+    time_map = None
+    if vad in ("energy", "both") and not isinstance(audio, str):
+        total = len(audio)
+        audio, spans = trim_silence(audio)
+        time_map = _span_time_map(spans)
+        print(f"Energy VAD kept {len(audio) / max(total, 1):.0%} of the audio.")
+        if len(audio) == 0:
+            raise RecmeetError("Transcription produced no text (recording is silent).")
+    elif vad in ("energy", "both"):
+        print(f"Warning: {audio_path} is not in the recorder format; skipping energy VAD.",
+              file=sys.stderr)
+
+    print(f"Transcribing ({backend})...")
+    segments, detail = transcriber.transcribe(audio, vad_filter=vad in ("silero", "both"))
+
+    with open(transcript_path, "w") as f:
+        count, has_text = _write_segments(f, segments, time_map=time_map)
+
+    if not has_text:
         raise RecmeetError("Transcription produced no text.")
 
-    print(f"Transcribed {len(lines)} segments (language: {info.language}, prob: {info.language_probability:.2f})")
-    return transcript
+    print(f"Transcribed {count} segments ({detail})")
+    return transcript_path
+
 
+def _atomic_write_text(path, text):
+    """Write text to path via a temporary sibling and rename, so readers never see a partial file.
 
-def summarize_transcript(transcript, api_key):
-    """Summarize the transcript using xAI Grok API."""
+    Writes the UTF-8 bytes straight to the fd (no TextIOWrapper layer) and
+    fsyncs before the rename, so a crash leaves either the old file or the new one.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _summary_cache_key(transcript):
+    """Content hash identifying a summary request (prompts + model + transcript)."""
+    payload = SUMMARY_SYSTEM_PROMPT + SUMMARY_USER_PROMPT + SUMMARY_MODEL + transcript
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _summary_cache_path(key):
+    return SUMMARY_CACHE_DIR / key[:2] / f"{key}.md"
+
+
+@lru_cache(maxsize=1)
+def _get_embedder():
+    """Load the optional sentence-transformers model used for near-duplicate lookup."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    return SentenceTransformer("all-MiniLM-L6-v2", cache_folder=str(CACHE_DIR / "embeddings"))
+
+
+_embedder_failed = False  # set once loading or encoding fails; lookup stays off for the process
+
+
+def _embed_transcript(transcript):
+    """Return a unit-length embedding of the whole transcript, or None if unavailable.
+
+    The model truncates long inputs, so the transcript is embedded in pieces and
+    the piece embeddings are averaged. Failures (e.g. the model can't be
+    downloaded) disable near-duplicate lookup instead of failing the summary.
+    """
+    global _embedder_failed
+    if _embedder_failed:
+        return None
+    try:
+        embedder = _get_embedder()
+        if embedder is None:
+            return None
+        pieces = [transcript[i:i + 2000] for i in range(0, len(transcript), 2000)] or [""]
+        mean = embedder.encode(pieces, normalize_embeddings=True).mean(axis=0)
+    except Exception as e:
+        _embedder_failed = True
+        print(f"Warning: Near-duplicate summary lookup disabled — {e}", file=sys.stderr)
+        return None
+    norm = float((mean * mean).sum()) ** 0.5 or 1.0
+    return [float(x) / norm for x in mean]
+
+
+def _find_similar_summary(embedding):
+    """Return the cached summary whose transcript embedding is closest above the threshold."""
+    best_key, best_score = None, SUMMARY_SIMILARITY_THRESHOLD
+    try:
+        with open(SUMMARY_CACHE_DIR / "index.jsonl") as f:
+            for line in f:
+                entry = json.loads(line)
+                score = sum(a * b for a, b in zip(embedding, entry["embedding"]))
+                if score >= best_score:
+                    best_key, best_score = entry["key"], score
+    except (OSError, ValueError, KeyError):
+        return None
+    if best_key is None:
+        return None
+    try:
+        return _summary_cache_path(best_key).read_text() or None
+    except OSError:
+        return None
+
+
+def _store_summary(key, summary, embedding=None):
+    """Persist a summary in the content-addressed cache (failures are non-fatal)."""
+    path = _summary_cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(path, summary)
+        if embedding is not None:
+            with open(SUMMARY_CACHE_DIR / "index.jsonl", "a") as f:
+                f.write(json.dumps({"key": key, "embedding": embedding}) + "\n")
+    except OSError as e:
+        print(f"Warning: Could not cache summary: {e}", file=sys.stderr)
+
+
+def summarize_transcript(transcript, api_key, out=None, on_progress=None, match_similar=False):
+    """Summarize the transcript using xAI Grok API.
+
+    Results are cached under SUMMARY_CACHE_DIR keyed by a hash of the prompts,
+    model, and transcript. With match_similar (and sentence-transformers
+    installed), a near-identical earlier transcript also counts as a cache hit.
+    It is off by default because recurring meetings can look near-identical.
+
+    If `out` (a writable text file) is given, the final summary is streamed into
+    it as Grok generates it, and on_progress (if given) is called with the
+    number of tokens received so far at each flush. The complete summary is
+    always returned.
+    """
+    key = _summary_cache_key(transcript)
+    cached = None
+    try:
+        # An empty entry (written before empty summaries were rejected) is a miss
+        cached = _summary_cache_path(key).read_text() or None
+    except OSError:
+        pass
+    if cached is not None:
+        print("Using cached summary.")
+
+    embedding = None
+    if cached is None and match_similar:
+        embedding = _embed_transcript(transcript)
+        if embedding is not None:
+            cached = _find_similar_summary(embedding)
+            if cached is not None:
+                print("Using cached summary (near-duplicate transcript).")
+
+    if cached is not None:
+        if out is not None:
+            out.write(cached)
+        return cached
+
+    chunks = _chunk_transcript(transcript)
+    if len(chunks) == 1:
+        print("Requesting Grok summary...")
+        summary = _request_completion(SUMMARY_USER_PROMPT.format(transcript=transcript), api_key,
+                                      out=out, on_progress=on_progress)
+    else:
+        summary = _map_reduce_summary(chunks, api_key, out=out, on_progress=on_progress)
+
+    if not summary.strip():
+        raise RuntimeError("Grok returned an empty summary.")
+    _store_summary(key, summary, embedding)
+    return summary
+
+
+def _read_stream(response, out, on_progress=None):
+    """Consume an OpenAI-style SSE completion stream, writing deltas to out as they arrive.
+
+    out is flushed every SUMMARY_FLUSH_CHARS characters rather than per delta;
+    on_progress(tokens_so_far) is called after each flush. Each SSE delta
+    carries roughly one token.
+    """
+    parts = []
+    pending = 0
+    # SSE is always UTF-8, but requests assumes ISO-8859-1 for text/* without a charset
+    for raw in response.iter_lines():
+        line = raw.decode("utf-8")
+        if not line.startswith("data: "):
+            continue
+        payload = line[len("data: "):]
+        if payload == "[DONE]":
+            break
+        event = json.loads(payload)
+        if "error" in event:
+            raise RuntimeError(f"Grok API error (in stream): {event['error']}")
+        choices = event.get("choices") or [{}]
+        delta = (choices[0].get("delta") or {}).get("content")
+        if delta:
+            parts.append(delta)
+            out.write(delta)
+            pending += len(delta)
+            if pending >= SUMMARY_FLUSH_CHARS:
+                out.flush()
+                pending = 0
+                if on_progress is not None:
+                    on_progress(len(parts))
+    out.flush()
+    return "".join(parts)
+
+
+def _request_completion(prompt, api_key, out=None, on_progress=None):
+    """Send one summarization chat request to Grok and return the response text.
+
+    If `out` is given, the response is requested as a stream and written to it
+    incrementally (see _read_stream for on_progress).
+    """
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     data = {
-        "model": "grok-3",
+        "model": SUMMARY_MODEL,
         "messages": [
             {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
-            {"role": "user", "content": SUMMARY_USER_PROMPT.format(transcript=transcript)},
+            {"role": "user", "content": prompt},
         ],
         "temperature": 0.3,
         "max_tokens": 4096,
     }
+    stream = out is not None
+    if stream:
+        data["stream"] = True
 
-    print("Requesting Grok summary...")
-    response = requests.post(API_URL, headers=headers, json=data, timeout=120)
+    # The context manager returns the connection to the pool even for streamed bodies
+    with _session().post(API_URL, headers=headers, json=data, timeout=API_TIMEOUT, stream=stream) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"Grok API error ({response.status_code}): {response.text}")
+        if stream:
+            return _read_stream(response, out, on_progress)
+        return response.json()["choices"][0]["message"]["content"]
 
-    if response.status_code != 200:
-        raise RuntimeError(f"Grok API error ({response.status_code}): {response.text}")
 
-    return response.json()["choices"][0]["message"]["content"]
+def _chunk_transcript(transcript, max_tokens=SUMMARY_CHUNK_TOKENS,
+                      overlap_tokens=SUMMARY_CHUNK_OVERLAP_TOKENS):
+    """Split a transcript into chunks of roughly max_tokens, breaking only between lines.
+
+    Each chunk after the first repeats up to overlap_tokens of trailing lines from
+    the previous one, so statements spanning a boundary keep their context.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    overlap_chars = overlap_tokens * CHARS_PER_TOKEN
+    chunks = []
+    current = []
+    size = 0
+    fresh = False  # current holds lines not yet emitted in any chunk
+    for line in transcript.splitlines(keepends=True):
+        if fresh and size + len(line) > max_chars:
+            chunks.append("".join(current))
+            tail = []
+            tail_size = 0
+            for prev in reversed(current):
+                if tail_size + len(prev) > overlap_chars:
+                    break
+                tail.insert(0, prev)
+                tail_size += len(prev)
+            current, size = tail, tail_size
+        current.append(line)
+        size += len(line)
+        fresh = True
+    if fresh or not chunks:
+        chunks.append("".join(current))
+    return chunks
+
+
+def _summarize_chunk(numbered_chunk, total, api_key):
+    index, chunk = numbered_chunk
+    prompt = SUMMARY_MAP_PROMPT.format(index=index, total=total, transcript=chunk)
+    return _request_completion(prompt, api_key)
+
+
+def _map_reduce_summary(chunks, api_key, out=None, on_progress=None):
+    """Summarize each chunk in parallel, then merge the partial notes into one summary."""
+    total = len(chunks)
+    print(f"Requesting Grok summary ({total} parts)...")
+    with ThreadPoolExecutor(max_workers=SUMMARY_MAP_WORKERS) as executor:
+        partials = list(executor.map(
+            partial(_summarize_chunk, total=total, api_key=api_key),
+            enumerate(chunks, 1),
+        ))
+
+    notes = "\n\n".join(
+        f"--- Notes for part {i} of {total} ---\n{text.strip()}"
+        for i, text in enumerate(partials, 1)
+    )
+    return _request_completion(SUMMARY_USER_PROMPT.format(transcript=notes), api_key,
+                               out=out, on_progress=on_progress)
 
 
 def create_output_dir(base_dir):
-    """Create a timestamped output directory, handling collisions."""
+    """Create a timestamped output directory, handling collisions.
+
+    mkdir itself is the existence check, so the common case is a single
+    syscall and two concurrent sessions can never claim the same directory.
+    """
+    base_dir = Path(base_dir)
+    base_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-    out_dir = Path(base_dir) / timestamp
 
-    if out_dir.exists():
+    for i in range(1, 100):
         # Append a suffix to avoid collision
-        for i in range(2, 100):
-            candidate = Path(base_dir) / f"{timestamp}_{i}"
-            if not candidate.exists():
-                out_dir = candidate
-                break
-        else:
-            raise RecmeetError("Too many sessions in the same minute.")
-
-    out_dir.mkdir(parents=True)
-    return out_dir
+        out_dir = base_dir / (timestamp if i == 1 else f"{timestamp}_{i}")
+        try:
+            out_dir.mkdir()
+            return out_dir
+        except FileExistsError:
+            continue
+    raise RecmeetError("Too many sessions in the same minute.")
 
 
 def parse_args():
@@ -436,9 +1488,35 @@ def parse_args():
                         help="Monitor/speaker source (auto-detected if omitted; 'default' for system default output)")
     parser.add_argument("--mic-only", action="store_true", help="Record mic only (skip monitor capture)")
     parser.add_argument("--model", default="base", help="Whisper model: tiny/base/small/medium/large-v3 (default: base)")
+    parser.add_argument("--backend", default="faster-whisper", choices=TRANSCRIBE_BACKENDS,
+                        help="Transcription backend (default: faster-whisper)")
+    parser.add_argument("--quantization", default="int8", choices=list(GGML_QUANT_SUFFIXES),
+                        help="ggml model quantization for --backend whispercpp (default: int8)")
+    parser.add_argument("--device", default="auto", choices=["auto", "cpu", "cuda"],
+                        help="Whisper inference device (default: auto — CUDA if available)")
+    parser.add_argument("--compute-type", default="auto",
+                        help="CTranslate2 compute type: int8/int8_float16/float16/float32 "
+                             "(default: auto — int8_float16 on CUDA, int8 on CPU)")
+    parser.add_argument("--beam-size", type=int, default=5, help="Whisper beam size (default: 5)")
+    parser.add_argument("--vad", default="silero", choices=VAD_MODES,
+                        help="Silence skipping: faster-whisper's Silero VAD, NumPy energy trimming, "
+                             "both, or none (default: silero)")
+    parser.add_argument("--threads", type=int, default=0,
+                        help="CPU threads for Whisper inference (default: 0 = all available cores)")
+    parser.add_argument("--language",
+                        help="Spoken language code, e.g. en (default: auto-detect; "
+                             "setting it skips Whisper's language detection)")
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="30s windows decoded per batch with Silero VAD; 1 disables batching "
+                             "(default: 0 = auto — 16 on CUDA, threads/4 on CPU)")
+    parser.add_argument("--rolling", action="store_true",
+                        help=f"Transcribe in {ROLLING_CHUNK_SECONDS}s windows while recording (lower end-to-end latency)")
     parser.add_argument("--output-dir", default="./meetings", help="Base directory for outputs (default: ./meetings)")
     parser.add_argument("--api-key", help="xAI API key (default: from env/dotenv)")
     parser.add_argument("--no-summary", action="store_true", help="Skip Grok summary (record + transcribe only)")
+    parser.add_argument("--match-similar-summaries", action="store_true",
+                        help="Reuse the cached summary of a near-identical earlier transcript "
+                             "(needs sentence-transformers)")
     parser.add_argument("--device-pattern", default=DEFAULT_DEVICE_PATTERN, help=f"Regex for device auto-detection (default: {DEFAULT_DEVICE_PATTERN})")
     return parser.parse_args()
 
@@ -460,7 +1538,7 @@ def _resolve_monitor_source(args, detected=None):
 
     # --monitor default: use the system default output's monitor
     if args.monitor == "default":
-        all_sources = detected["all_sources"] if detected else _list_pactl_sources()
+        all_sources = detected["all_sources"] if detected else _pactl_sources_cached()
         for name in all_sources:
             if name.endswith(".monitor"):
                 return name
@@ -473,8 +1551,34 @@ def _resolve_monitor_source(args, detected=None):
     return detected["monitor"]
 
 
+def summarize_to_file(transcript_path, summary_path, api_key, on_progress=None, match_similar=False):
+    """Summarize transcript_path into summary_path, streaming the output.
+
+    on_progress(tokens_so_far) is called periodically while Grok streams;
+    match_similar is passed to summarize_transcript.
+    Failures are reported as warnings rather than raised, since the transcript
+    is still usable. Returns summary_path on success, otherwise None.
+    """
+    notify("Summarizing...", "Sending to Grok")
+    try:
+        with open(summary_path, "w") as f:
+            summarize_transcript(Path(transcript_path).read_text(), api_key, out=f,
+                                 on_progress=on_progress, match_similar=match_similar)
+    except Exception as e:
+        Path(summary_path).unlink(missing_ok=True)
+        print(f"\nWarning: Summary failed — {e}", file=sys.stderr)
+        print("Transcript is still available.", file=sys.stderr)
+        return None
+    print(f"Summary saved:    {summary_path}")
+    return summary_path
+
+
 def run_pipeline(out_dir, mic_source, monitor_source=None, model_name="base",
-                 api_key=None, no_summary=False, stop_event=None, on_phase=None):
+                 api_key=None, no_summary=False, stop_event=None, on_phase=None,
+                 device="auto", compute_type="auto", beam_size=5, threads=0, rolling=False,
+                 summary_executor=None, vad="silero", backend="faster-whisper",
+                 quantization="int8", on_summary_progress=None, batch_size=0, language=None,
+                 match_similar_summaries=False):
     """Full pipeline: record -> validate -> mix -> transcribe -> summarize.
 
     Args:
@@ -487,9 +1591,32 @@ def run_pipeline(out_dir, mic_source, monitor_source=None, model_name="base",
         stop_event: threading.Event to signal recording stop (None for CLI/Ctrl+C mode).
         on_phase: Optional callback(phase_name) for UI updates. Called with
                   "recording", "transcribing", "summarizing", "complete".
+        device: Whisper inference device ("auto", "cpu", or "cuda").
+        compute_type: CTranslate2 compute type ("auto" picks per device).
+        beam_size: Whisper beam search width.
+        threads: CPU threads for Whisper inference (0 = all available cores).
+        rolling: Transcribe in ROLLING_CHUNK_SECONDS windows while recording,
+                 instead of transcribing the whole file after recording stops.
+        summary_executor: Optional concurrent.futures.Executor. When given, the
+                 summary is submitted to it and run_pipeline returns as soon as
+                 the transcript is written.
+        vad: Silence-skipping mode for transcription (see transcribe_audio).
+                 Must be "silero" with rolling.
+        backend: Transcription backend, one of TRANSCRIBE_BACKENDS. Must be
+                 "faster-whisper" with rolling.
+        quantization: ggml weight quantization for the whispercpp backend.
+        on_summary_progress: Optional callback(tokens_so_far), called from the
+                 summarizing thread as the summary streams in.
+        batch_size: 30s windows decoded per batch by faster-whisper (0 = auto
+                 for the device, 1 = sequential). Must not exceed 1 with rolling.
+        language: Spoken language code (e.g. "en"), or None to auto-detect.
+        match_similar_summaries: Reuse the cached summary of a near-identical
+                 earlier transcript (needs sentence-transformers).
 
     Returns:
-        dict with keys: transcript_path, summary_path (or None), out_dir.
+        dict with keys: transcript_path, summary_path (or None), out_dir, and
+        summary_future (a Future resolving to summary_path or None, when
+        summary_executor was used; otherwise None).
 
     Raises:
         RecmeetError: On fatal errors (device, transcription, etc.).
@@ -505,53 +1632,81 @@ def run_pipeline(out_dir, mic_source, monitor_source=None, model_name="base",
         if on_phase:
             on_phase(name)
 
-    # Record
-    _phase("recording")
-    if dual_mode:
-        mic_path = out_dir / "mic.wav"
-        monitor_path = out_dir / "monitor.wav"
-        notify("Recording started", f"Mic: {mic_source}\nMonitor: {monitor_source}")
-        record_dual_audio(mic_source, monitor_source, mic_path, monitor_path, stop_event=stop_event)
+    mic_path = out_dir / "mic.wav"
+    monitor_path = out_dir / "monitor.wav"
 
-        # Validate mic (fatal)
-        validate_audio(mic_path, label="Mic audio")
-
-        # Validate monitor (non-fatal — monitor may be silent)
-        try:
-            validate_audio(monitor_path, label="Monitor audio")
-        except AudioValidationError as e:
-            print(f"Warning: Monitor audio unusable ({e}). Using mic only.", file=sys.stderr)
-            import shutil
-            shutil.copy2(str(mic_path), str(audio_path))
-            dual_mode = False
+    mixed = None
+    transcriber = None
+    check_transcription_options(backend, model_name, quantization, vad, batch_size, rolling)
+    if rolling:
+        tracks = [mic_path, monitor_path] if dual_mode else [audio_path]
+        transcriber = RollingTranscriber(tracks, transcript_path, model_name, device=device,
+                                         compute_type=compute_type, beam_size=beam_size,
+                                         threads=threads, language=language)
+        transcriber.start()
 
+    # Record
+    _phase("recording")
+    try:
         if dual_mode:
-            mix_audio(mic_path, monitor_path, audio_path)
-    else:
-        notify("Recording started", f"Source: {mic_source}")
-        record_audio(mic_source, audio_path, stop_event=stop_event)
-        validate_audio(audio_path)
+            notify("Recording started", f"Mic: {mic_source}\nMonitor: {monitor_source}")
+            record_dual_audio(mic_source, monitor_source, mic_path, monitor_path, stop_event=stop_event)
+
+            # Validate mic (fatal)
+            validate_audio(mic_path, label="Mic audio")
+
+            # Validate monitor (non-fatal — monitor may be silent)
+            try:
+                validate_audio(monitor_path, label="Monitor audio")
+            except AudioValidationError as e:
+                print(f"Warning: Monitor audio unusable ({e}). Using mic only.", file=sys.stderr)
+                shutil.copy2(mic_path, audio_path)
+                dual_mode = False
+
+            # Nothing to mix in if the monitor only captured silence
+            if dual_mode:
+                level = _level_dbfs(monitor_path)
+                if level is not None and level < SILENCE_THRESHOLD_DBFS:
+                    print(f"Monitor audio is silent ({level:.1f} dBFS). Using mic only.")
+                    shutil.copy2(mic_path, audio_path)
+                    dual_mode = False
+
+            if dual_mode:
+                mixed = mix_audio(mic_path, monitor_path, audio_path)
+        else:
+            notify("Recording started", f"Source: {mic_source}")
+            record_audio(mic_source, audio_path, stop_event=stop_event)
+            validate_audio(audio_path)
+    except BaseException:
+        if transcriber:
+            transcriber.abort()
+        raise
 
     # Transcribe
     _phase("transcribing")
     notify("Transcribing...", f"Model: {model_name}")
-    transcript = transcribe_audio(audio_path, model_name)
-    transcript_path.write_text(transcript)
+    if transcriber:
+        transcriber.finish()
+    else:
+        transcribe_audio(audio_path, transcript_path, model_name, device=device,
+                         compute_type=compute_type, beam_size=beam_size, threads=threads,
+                         pcm=mixed, vad=vad, backend=backend, quantization=quantization,
+                         batch_size=batch_size, language=language)
     print(f"Transcript saved: {transcript_path}")
 
     # Summarize
-    result = {"transcript_path": transcript_path, "summary_path": None, "out_dir": out_dir}
+    result = {"transcript_path": transcript_path, "summary_path": None,
+              "summary_future": None, "out_dir": out_dir}
     if not no_summary and api_key:
         _phase("summarizing")
-        notify("Summarizing...", "Sending to Grok")
-        try:
-            summary = summarize_transcript(transcript, api_key)
-            summary_path.write_text(summary)
-            print(f"Summary saved:    {summary_path}")
-            result["summary_path"] = summary_path
-        except Exception as e:
-            print(f"\nWarning: Summary failed — {e}", file=sys.stderr)
-            print("Transcript is still available.", file=sys.stderr)
+        if summary_executor is not None:
+            result["summary_future"] = summary_executor.submit(
+                summarize_to_file, transcript_path, summary_path, api_key, on_summary_progress,
+                match_similar_summaries,
+            )
+        else:
+            result["summary_path"] = summarize_to_file(transcript_path, summary_path, api_key,
+                                                       on_summary_progress, match_similar_summaries)
     else:
         print("Summary skipped (--no-summary).")
 
@@ -562,7 +1717,18 @@ def run_pipeline(out_dir, mic_source, monitor_source=None, model_name="base",
     return result
 
 
+def _exit_on_signal(signum, _frame):
+    """Turn SIGTERM/SIGHUP into SystemExit so the recorders' finally blocks still run.
+
+    The recorders run in their own session (start_new_session=True), so they
+    don't get the terminal's SIGHUP and would otherwise outlive the CLI.
+    """
+    raise SystemExit(128 + signum)
+
+
 def main():
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    signal.signal(signal.SIGHUP, _exit_on_signal)
     load_dotenv()
     args = parse_args()
 
@@ -611,6 +1777,17 @@ def main():
             model_name=args.model,
             api_key=api_key,
             no_summary=args.no_summary,
+            device=args.device,
+            compute_type=args.compute_type,
+            beam_size=args.beam_size,
+            threads=args.threads,
+            rolling=args.rolling,
+            vad=args.vad,
+            backend=args.backend,
+            quantization=args.quantization,
+            batch_size=args.batch_size,
+            language=args.language,
+            match_similar_summaries=args.match_similar_summaries,
         )
 
     except (RecmeetError, AudioValidationError) as e:
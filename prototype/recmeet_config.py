@@ -5,12 +5,27 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
 CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "recmeet"
 CONFIG_PATH = CONFIG_DIR / "config.yaml"
 
 DEFAULTS = {
     "model": "base",
+    "device": "auto",
+    "compute_type": "auto",
+    "vad": "silero",
+    "backend": "faster-whisper",
+    "quantization": "int8",
+    "batch_size": 0,
+    "language": "",
     "no_summary": False,
+    "match_similar_summaries": False,
     "mic_only": False,
     "output_dir": "./meetings",
     "device_pattern": r"bd.h200|00:05:30:00:05:4E",
@@ -21,19 +36,16 @@ DEFAULTS = {
 
 
 def load_config():
-    """Load config from YAML, merged with defaults. Missing keys get defaults."""
-    config = dict(DEFAULTS)
+    """Load config from YAML, merged with defaults. Missing or null keys get defaults."""
     if CONFIG_PATH.exists():
         try:
             with open(CONFIG_PATH) as f:
-                on_disk = yaml.safe_load(f)
+                on_disk = yaml.load(f, Loader=_Loader)
             if isinstance(on_disk, dict):
-                for key, value in on_disk.items():
-                    if value is not None:
-                        config[key] = value
+                return {**DEFAULTS, **{k: v for k, v in on_disk.items() if v is not None}}
         except (yaml.YAMLError, OSError) as e:
             print(f"Warning: Could not read {CONFIG_PATH}: {e}")
-    return config
+    return dict(DEFAULTS)
 
 
 def save_config(config):
@@ -51,7 +63,7 @@ def save_config(config):
     with open(CONFIG_PATH, "w") as f:
         f.write("# recmeet configuration\n")
         f.write("# Edit this file or use the tray menu to change settings.\n\n")
-        yaml.dump(clean, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(clean, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
 
 def generate_initial_config(all_sources=None):
@@ -79,7 +91,23 @@ def generate_initial_config(all_sources=None):
         "# Edit this file or use the tray menu to change settings.",
         "",
         f"model: {DEFAULTS['model']}",
+        "# Whisper device: auto | cpu | cuda",
+        f"device: {DEFAULTS['device']}",
+        "# Compute type: auto | int8 | int8_float16 | float16 | float32",
+        f"compute_type: {DEFAULTS['compute_type']}",
+        "# Silence skipping: silero | energy | both | none",
+        f"vad: {DEFAULTS['vad']}",
+        "# Transcription backend: faster-whisper | distil-whisper | whispercpp",
+        f"backend: {DEFAULTS['backend']}",
+        "# ggml quantization (whispercpp only): f16 | int8 | int5 | int4",
+        f"quantization: {DEFAULTS['quantization']}",
+        "# Windows decoded per batch (0 = auto, 1 = no batching)",
+        f"batch_size: {DEFAULTS['batch_size']}",
+        "# Spoken language code, e.g. en (leave empty to auto-detect)",
+        'language: ""',
         f"no_summary: {str(DEFAULTS['no_summary']).lower()}",
+        "# Reuse a near-identical earlier transcript's summary (needs sentence-transformers)",
+        f"match_similar_summaries: {str(DEFAULTS['match_similar_summaries']).lower()}",
         f"mic_only: {str(DEFAULTS['mic_only']).lower()}",
         "# api_key: xai-your-key-here",
         f"output_dir: {DEFAULTS['output_dir']}",
@@ -127,12 +155,28 @@ def apply_cli_overrides(config, args):
         config["monitor_source"] = args.monitor
     if getattr(args, "model", None):
         config["model"] = args.model
+    if getattr(args, "device", None) and args.device != "auto":
+        config["device"] = args.device
+    if getattr(args, "compute_type", None) and args.compute_type != "auto":
+        config["compute_type"] = args.compute_type
+    if getattr(args, "vad", None) and args.vad != "silero":
+        config["vad"] = args.vad
+    if getattr(args, "backend", None) and args.backend != "faster-whisper":
+        config["backend"] = args.backend
+    if getattr(args, "quantization", None) and args.quantization != "int8":
+        config["quantization"] = args.quantization
+    if getattr(args, "batch_size", 0):
+        config["batch_size"] = args.batch_size
+    if getattr(args, "language", None):
+        config["language"] = args.language
     if getattr(args, "output_dir", None):
         config["output_dir"] = args.output_dir
     if getattr(args, "api_key", None):
         config["api_key"] = args.api_key
     if getattr(args, "no_summary", False):
         config["no_summary"] = True
+    if getattr(args, "match_similar_summaries", False):
+        config["match_similar_summaries"] = True
     if getattr(args, "mic_only", False):
         config["mic_only"] = True
     if getattr(args, "device_pattern", None):
@@ -2,11 +2,21 @@
 """recmeet_tray — System tray applet for recmeet meeting recorder."""
 
 import os
+import signal
 import subprocess
 import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from dotenv import find_dotenv, load_dotenv
+
+# Parse .env while the GTK bindings import below; joined in RecmeetTray.__init__.
+# The path is resolved here because find_dotenv searches from the caller's file.
+_dotenv_loader = threading.Thread(target=load_dotenv, args=(find_dotenv(),), daemon=True)
+_dotenv_loader.start()
+
 import gi
 
 gi.require_version("Gtk", "3.0")
@@ -14,8 +24,6 @@ gi.require_version("AyatanaAppIndicator3", "0.1")
 from gi.repository import AyatanaAppIndicator3 as AppIndicator
 from gi.repository import GLib, Gtk
 
-from dotenv import load_dotenv
-
 import recmeet
 from recmeet_config import load_config, save_config, generate_initial_config
 
@@ -29,12 +37,17 @@ WHISPER_MODELS = ["tiny", "base", "small", "medium", "large-v3"]
 
 class RecmeetTray:
     def __init__(self):
-        load_dotenv()
+        _dotenv_loader.join()
         self.config = load_config()
         self.state = "idle"  # idle | recording | processing
         self.stop_event = None
-        self.worker_thread = None
         self._sources_cache = None
+        self._tick_source = None
+        self._record_started = None
+        # Separate pools so a recording never queues behind pending summaries,
+        # and the tray can record again while Grok is still summarizing
+        self._pipeline_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recmeet-pipeline")
+        self._summary_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recmeet-summary")
 
         self.indicator = AppIndicator.Indicator.new(
             "recmeet",
@@ -43,9 +56,23 @@ class RecmeetTray:
         )
         self.indicator.set_status(AppIndicator.IndicatorStatus.ACTIVE)
 
+        # Load the Whisper model in the background so the first meeting
+        # doesn't pay the model load cost after recording stops.
+        self._warm_model(self.config.get("model", "base"))
+
         self._refresh_sources()
         self._build_menu()
 
+    def _warm_model(self, model_name):
+        """Load model_name into recmeet's model cache on a background thread."""
+        if self.config.get("backend", "faster-whisper") != "faster-whisper":
+            return
+        threading.Thread(
+            target=recmeet.warm_whisper,
+            args=(model_name, self.config.get("device", "auto"), self.config.get("compute_type", "auto")),
+            daemon=True,
+        ).start()
+
     # ── Source detection ──────────────────────────────────────────────
 
     def _refresh_sources(self):
@@ -67,73 +94,27 @@ class RecmeetTray:
     # ── Menu construction ─────────────────────────────────────────────
 
     def _build_menu(self):
+        """Build the menu once. State and device changes later mutate the stored items."""
         menu = Gtk.Menu()
 
-        # Record / Stop
-        if self.state == "idle":
-            item = Gtk.MenuItem(label="Record")
-            item.connect("activate", self._on_record)
-            menu.append(item)
-        elif self.state == "recording":
-            item = Gtk.MenuItem(label="Stop Recording")
-            item.connect("activate", self._on_stop)
-            menu.append(item)
-        else:  # processing
-            item = Gtk.MenuItem(label="Processing...")
-            item.set_sensitive(False)
-            menu.append(item)
+        # Record / Stop (label and sensitivity follow self.state)
+        self._record_item = Gtk.MenuItem(label="Record")
+        self._record_item.connect("activate", self._on_record_item)
+        menu.append(self._record_item)
 
         menu.append(Gtk.SeparatorMenuItem())
 
         # Mic Source submenu
-        mic_menu = Gtk.Menu()
-        mic_item = Gtk.MenuItem(label="Mic Source")
-        mic_item.set_submenu(mic_menu)
-
-        current_mic = self.config.get("mic_source", "")
-        group = []
-
-        auto_mic = Gtk.RadioMenuItem(label="Auto-detect")
-        if not current_mic:
-            auto_mic.set_active(True)
-        auto_mic.connect("toggled", self._on_mic_selected, "")
-        mic_menu.append(auto_mic)
-        group = [auto_mic]
-
-        for source in self._sources_cache.get("mics", []):
-            item = Gtk.RadioMenuItem(label=source, group=group[0])
-            if source == current_mic:
-                item.set_active(True)
-            item.connect("toggled", self._on_mic_selected, source)
-            mic_menu.append(item)
-            group.append(item)
-
-        menu.append(mic_item)
+        self._mic_menu, self._mic_items = self._build_source_submenu(
+            menu, "Mic Source", self.config.get("mic_source", ""), self._on_mic_selected,
+        )
 
         # Monitor Source submenu
-        mon_menu = Gtk.Menu()
-        mon_item = Gtk.MenuItem(label="Monitor Source")
-        mon_item.set_submenu(mon_menu)
-
-        current_mon = self.config.get("monitor_source", "")
-        group = []
-
-        auto_mon = Gtk.RadioMenuItem(label="Auto-detect")
-        if not current_mon:
-            auto_mon.set_active(True)
-        auto_mon.connect("toggled", self._on_monitor_selected, "")
-        mon_menu.append(auto_mon)
-        group = [auto_mon]
-
-        for source in self._sources_cache.get("monitors", []):
-            item = Gtk.RadioMenuItem(label=source, group=group[0])
-            if source == current_mon:
-                item.set_active(True)
-            item.connect("toggled", self._on_monitor_selected, source)
-            mon_menu.append(item)
-            group.append(item)
+        self._mon_menu, self._mon_items = self._build_source_submenu(
+            menu, "Monitor Source", self.config.get("monitor_source", ""), self._on_monitor_selected,
+        )
 
-        menu.append(mon_item)
+        self._sync_source_items()
 
         # Model submenu
         model_menu = Gtk.Menu()
@@ -142,6 +123,7 @@ class RecmeetTray:
 
         current_model = self.config.get("model", "base")
         group = []
+        self._model_items = {}
 
         for i, model_name in enumerate(WHISPER_MODELS):
             if i == 0:
@@ -154,21 +136,22 @@ class RecmeetTray:
             item.connect("toggled", self._on_model_selected, model_name)
             model_menu.append(item)
             group.append(item)
+            self._model_items[model_name] = item
 
         menu.append(model_item)
 
         menu.append(Gtk.SeparatorMenuItem())
 
         # Checkboxes
-        mic_only = Gtk.CheckMenuItem(label="Mic Only")
-        mic_only.set_active(self.config.get("mic_only", False))
-        mic_only.connect("toggled", self._on_mic_only_toggled)
-        menu.append(mic_only)
+        self._mic_only_item = Gtk.CheckMenuItem(label="Mic Only")
+        self._mic_only_item.set_active(self.config.get("mic_only", False))
+        self._mic_only_item.connect("toggled", self._on_mic_only_toggled)
+        menu.append(self._mic_only_item)
 
-        no_summary = Gtk.CheckMenuItem(label="No Summary")
-        no_summary.set_active(self.config.get("no_summary", False))
-        no_summary.connect("toggled", self._on_no_summary_toggled)
-        menu.append(no_summary)
+        self._no_summary_item = Gtk.CheckMenuItem(label="No Summary")
+        self._no_summary_item.set_active(self.config.get("no_summary", False))
+        self._no_summary_item.connect("toggled", self._on_no_summary_toggled)
+        menu.append(self._no_summary_item)
 
         menu.append(Gtk.SeparatorMenuItem())
 
@@ -191,26 +174,108 @@ class RecmeetTray:
 
         menu.show_all()
         self.indicator.set_menu(menu)
+        self._update_record_item()
+
+    def _build_source_submenu(self, menu, label, current, handler):
+        """Append a source-selection submenu holding only its Auto-detect item.
+
+        Returns (submenu, items) where items maps source name ("" for auto) to its radio item.
+        """
+        submenu = Gtk.Menu()
+        item = Gtk.MenuItem(label=label)
+        item.set_submenu(submenu)
+
+        auto = Gtk.RadioMenuItem(label="Auto-detect")
+        if not current:
+            auto.set_active(True)
+        auto.connect("toggled", handler, "")
+        submenu.append(auto)
+
+        menu.append(item)
+        return submenu, {"": auto}
+
+    def _sync_source_items(self):
+        """Bring both source submenus in line with the cached source list."""
+        self._sync_source_submenu(
+            self._mic_menu, self._mic_items, self._sources_cache.get("mics", []),
+            self.config.get("mic_source", ""), self._on_mic_selected,
+        )
+        self._sync_source_submenu(
+            self._mon_menu, self._mon_items, self._sources_cache.get("monitors", []),
+            self.config.get("monitor_source", ""), self._on_monitor_selected,
+        )
+
+    def _sync_source_submenu(self, submenu, items, sources, current, handler):
+        """Remove items for vanished sources and insert items for new ones, in pactl order."""
+        wanted = set(sources)
+        for name in [n for n in items if n and n not in wanted]:
+            submenu.remove(items.pop(name))
+
+        group = items[""]
+        for pos, source in enumerate(sources, 1):
+            if source in items:
+                continue
+            item = Gtk.RadioMenuItem(label=source, group=group)
+            if source == current:
+                item.set_active(True)
+            item.connect("toggled", handler, source)
+            submenu.insert(item, pos)
+            item.show()
+            items[source] = item
+
+    def _sync_config_items(self):
+        """Point the setting items at the values in self.config (e.g. after the file was edited).
+
+        The toggled handlers see the config already matches and don't re-save it.
+        """
+        for items, key in ((self._mic_items, "mic_source"), (self._mon_items, "monitor_source"),
+                           (self._model_items, "model")):
+            item = items.get(self.config.get(key, ""))
+            if item is not None:
+                item.set_active(True)
+        self._mic_only_item.set_active(self.config.get("mic_only", False))
+        self._no_summary_item.set_active(self.config.get("no_summary", False))
+
+    def _update_record_item(self):
+        labels = {"idle": "Record", "recording": "Stop Recording", "processing": "Processing..."}
+        self._record_item.set_label(labels[self.state])
+        self._record_item.set_sensitive(self.state != "processing")
 
     # ── State transitions ─────────────────────────────────────────────
 
     def _set_state(self, state):
-        """Update state, icon, and rebuild menu. Must be called from GTK main thread."""
+        """Update state, icon, and record item. Must be called from GTK main thread."""
         self.state = state
         icons = {"idle": ICON_IDLE, "recording": ICON_RECORDING, "processing": ICON_PROCESSING}
         self.indicator.set_icon_full(icons[state], state)
-        self._build_menu()
+        if state != "recording" and self._tick_source is not None:
+            GLib.source_remove(self._tick_source)
+            self._tick_source = None
+        self._update_record_item()
+
+    def _update_elapsed(self):
+        """GLib timeout callback: show elapsed recording time on the record item."""
+        mins, secs = divmod(int(time.monotonic() - self._record_started), 60)
+        self._record_item.set_label(f"Stop Recording ({mins:02d}:{secs:02d})")
+        return GLib.SOURCE_CONTINUE
 
     # ── Recording pipeline ────────────────────────────────────────────
 
+    def _on_record_item(self, widget):
+        if self.state == "idle":
+            self._on_record(widget)
+        elif self.state == "recording":
+            self._on_stop(widget)
+
     def _on_record(self, _widget):
         if self.state != "idle":
             return
 
         self._set_state("recording")
+        self._record_started = time.monotonic()
+        self._tick_source = GLib.timeout_add_seconds(1, self._update_elapsed)
         self.stop_event = threading.Event()
-        self.worker_thread = threading.Thread(target=self._recording_pipeline, daemon=True)
-        self.worker_thread.start()
+        self._pipeline_pool.submit(self._recording_pipeline)
 
     def _on_stop(self, _widget):
         if self.state == "recording" and self.stop_event:
@@ -261,11 +326,23 @@ class RecmeetTray:
                 mic_source=mic_source,
                 monitor_source=monitor_source,
                 model_name=self.config.get("model", "base"),
+                device=self.config.get("device", "auto"),
+                compute_type=self.config.get("compute_type", "auto"),
+                vad=self.config.get("vad", "silero"),
+                backend=self.config.get("backend", "faster-whisper"),
+                quantization=self.config.get("quantization", "int8"),
+                batch_size=self.config.get("batch_size", 0),
+                language=self.config.get("language") or None,
+                match_similar_summaries=self.config.get("match_similar_summaries", False),
                 api_key=api_key,
                 no_summary=no_summary,
                 stop_event=self.stop_event,
                 on_phase=on_phase,
+                summary_executor=self._summary_pool,
+                on_summary_progress=lambda tokens: GLib.idle_add(self._summary_progress, tokens),
             )
+            if result["summary_future"] is not None:
+                result["summary_future"].add_done_callback(self._summary_finished)
 
             GLib.idle_add(self._pipeline_done, result)
 
@@ -274,37 +351,58 @@ class RecmeetTray:
 
     def _pipeline_done(self, result):
         self._set_state("idle")
+        # The pipeline reloaded the config file; show any edits in the menu
+        self._sync_config_items()
         recmeet.notify("Recording complete", str(result["out_dir"]))
 
+    def _summary_finished(self, future):
+        """Done-callback for a summary future (runs on the summary worker)."""
+        ok = not future.cancelled() and future.exception() is None
+        GLib.idle_add(self._summary_done, future.result() if ok else None)
+
+    def _summary_progress(self, tokens):
+        self.indicator.set_label(f"{tokens} tok", "00000 tok")
+
+    def _summary_done(self, summary_path):
+        self.indicator.set_label("", "")
+        if summary_path:
+            recmeet.notify("Summary ready", str(summary_path))
+        else:
+            recmeet.notify("Summary failed", "Transcript is still available.")
+
     def _pipeline_error(self, message):
         self._set_state("idle")
+        self._sync_config_items()
         recmeet.notify("Recording failed", message)
         print(f"Error: {message}", file=sys.stderr)
 
     # ── Menu callbacks ────────────────────────────────────────────────
 
     def _on_mic_selected(self, widget, source):
-        if widget.get_active():
+        if widget.get_active() and self.config.get("mic_source", "") != source:
             self.config["mic_source"] = source
             save_config(self.config)
 
     def _on_monitor_selected(self, widget, source):
-        if widget.get_active():
+        if widget.get_active() and self.config.get("monitor_source", "") != source:
             self.config["monitor_source"] = source
             save_config(self.config)
 
     def _on_model_selected(self, widget, model_name):
-        if widget.get_active():
+        if widget.get_active() and self.config.get("model") != model_name:
             self.config["model"] = model_name
             save_config(self.config)
+            self._warm_model(model_name)
 
     def _on_mic_only_toggled(self, widget):
-        self.config["mic_only"] = widget.get_active()
-        save_config(self.config)
+        if self.config.get("mic_only", False) != widget.get_active():
+            self.config["mic_only"] = widget.get_active()
+            save_config(self.config)
 
     def _on_no_summary_toggled(self, widget):
-        self.config["no_summary"] = widget.get_active()
-        save_config(self.config)
+        if self.config.get("no_summary", False) != widget.get_active():
+            self.config["no_summary"] = widget.get_active()
+            save_config(self.config)
 
     def _on_edit_config(self, _widget):
         from recmeet_config import CONFIG_PATH
@@ -330,8 +428,9 @@ class RecmeetTray:
                 recmeet.notify("Cannot open config", f"Edit manually: {CONFIG_PATH}")
 
     def _on_refresh_devices(self, _widget):
+        recmeet.invalidate_sources_cache()
         self._refresh_sources()
-        self._build_menu()
+        self._sync_source_items()
         n_mics = len(self._sources_cache.get("mics", []))
         n_mons = len(self._sources_cache.get("monitors", []))
         recmeet.notify("Devices refreshed", f"{n_mics} mic(s), {n_mons} monitor(s)")
@@ -339,14 +438,27 @@ class RecmeetTray:
     def _on_quit(self, _widget):
         if self.state == "recording" and self.stop_event:
             self.stop_event.set()
-            if self.worker_thread:
-                self.worker_thread.join(timeout=10)
+        # Hide the icon now; shutdown() finishes outstanding work once the loop exits
+        self.indicator.set_status(AppIndicator.IndicatorStatus.PASSIVE)
         Gtk.main_quit()
 
+    def shutdown(self):
+        """Wait for the running pipeline, then for its summary, so no files are left half-written.
+
+        The pipeline pool is drained first because the pipeline may still
+        submit its summary to the summary pool.
+        """
+        self._pipeline_pool.shutdown(wait=True)
+        self._summary_pool.shutdown(wait=True)
+
 
 def main():
-    tray = RecmeetTray()  # noqa: F841 — prevent GC of the tray object
+    tray = RecmeetTray()
+    # Recorders run in their own session, so stop them explicitly on logout/kill
+    for sig in (signal.SIGTERM, signal.SIGHUP):
+        GLib.unix_signal_add(GLib.PRIORITY_HIGH, sig, tray._on_quit, None)
     Gtk.main()
+    tray.shutdown()
 
 
 if __name__ == "__main__":